@@ -1,10 +1,15 @@
 from src.crawler import Crawler
+from src.utils.logger import setup_logging
 
 def main():
+    listener = setup_logging()
     start_url = 'https://example.com'  # Replace with your target website
     max_urls = 10
     crawler = Crawler(start_url, max_urls)
-    crawler.run()
+    try:
+        crawler.run()
+    finally:
+        listener.stop()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
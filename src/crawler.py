@@ -1,60 +1,145 @@
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
-import time
+from requests.adapters import HTTPAdapter
+from html import unescape
+from urllib.parse import urljoin, urlsplit
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import logging
+import re
 from src.url_frontier import URLFrontier
 from src.utils.robots_parser import RobotsParser
+from src.utils.dns_cache import install_dns_cache
+from src.utils.rate_limiter import RateLimiter
+from src.utils.logger import setup_logging
+from src.utils.url_utils import normalize_url, get_netloc
+
+logger = logging.getLogger(__name__)
+
+# Attribute scans stop at the next '<' so a run of unclosed tags stays linear.
+HREF_RE = re.compile(rb'<a\b[^<>]*?\shref\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))', re.I)
+BASE_RE = re.compile(rb'<base\b[^<>]*?\shref\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))', re.I)
+SKIP_PREFIXES = ('#', 'javascript:', 'mailto:', 'tel:', 'data:', 'about:', 'blob:', 'ws:', 'wss:')
+
+def decode_href(raw):
+    href = raw.decode('utf-8', 'replace').strip()
+    if '&' in href:
+        href = unescape(href)
+    return href
 
 class Crawler:
-    def __init__(self, start_url, max_urls=10):
+    def __init__(self, start_url, max_urls=10, concurrency=5, delay=1, max_per_host=2,
+                 max_content_bytes=2 * 1024 * 1024):
+        start_url = normalize_url(start_url)
         self.start_url = start_url
         self.max_urls = max_urls
+        self.concurrency = concurrency
+        self.delay = delay
+        self.max_content_bytes = max_content_bytes
         self.url_frontier = URLFrontier()
         self.url_frontier.add_url(start_url)
-        self.robots_parser = RobotsParser()
-        self.domain = urlparse(start_url).netloc
+        self.domain = get_netloc(start_url)
+        self._domain_prefixes = tuple(f'{scheme}://{self.domain}{sep}'
+                                      for scheme in ('http', 'https')
+                                      for sep in ('/', '?', '#'))
+        install_dns_cache()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.robots_parser = RobotsParser(self.session)
+        self.rate_limiter = RateLimiter(delay, max_per_host)
 
     def download_url(self, url):
         try:
-            response = requests.get(url, timeout=5)
-            return response.text
+            with self.session.get(url, timeout=5, stream=True) as response:
+                # Skip non-HTML bodies (PDFs, images) without reading them.
+                if 'html' not in response.headers.get('Content-Type', 'text/html').lower():
+                    return b''
+                content = bytearray()
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    content += chunk
+                    if len(content) >= self.max_content_bytes:
+                        break
+                return bytes(content[:self.max_content_bytes])
         except Exception as e:
-            print(f'Error downloading {url}: {e}')
-            return ''
+            logger.warning('Error downloading %s: %s', url, e)
+            return b''
 
     def get_linked_urls(self, url, html):
-        soup = BeautifulSoup(html, 'html.parser')
-        for link in soup.find_all('a'):
-            path = link.get('href')
-            if path and path.startswith('/'):
-                path = urljoin(url, path)
-            yield path
+        base = BASE_RE.search(html)
+        if base:
+            try:
+                url = urljoin(url, decode_href(base.group(base.lastindex)))
+            except ValueError:
+                pass
+        parts = urlsplit(url)
+        origin = f'{parts.scheme}://{parts.netloc}'
+        links = {}
+        # Only the href attribute is needed, so scan the raw bytes instead of
+        # building a DOM. Nav and footer links repeat within a page, so
+        # dedupe the raw values before any decoding or joining.
+        hrefs = dict.fromkeys(match.group(match.lastindex) for match in HREF_RE.finditer(html))
+        for href in hrefs:
+            path = decode_href(href)
+            # Schemes are case-insensitive; lowering the first 11 chars covers the
+            # longest prefix without copying the whole href.
+            if not path or path[:11].lower().startswith(SKIP_PREFIXES):
+                continue
+            try:
+                if path.startswith(('http://', 'https://')):
+                    link = path
+                elif path[0] == '/' and path[1:2] != '/' and '/.' not in path:
+                    link = origin + path
+                else:
+                    link = urljoin(url, path)
+                link = normalize_url(link)
+            except ValueError:
+                # Malformed href (e.g. an unclosed IPv6 bracket); skip just this one.
+                continue
+            if link.startswith(('http://', 'https://')):
+                links[link] = None
+        return list(links)
 
-    def add_url_to_frontier(self, url):
-        if urlparse(url).netloc == self.domain:
-            self.url_frontier.add_url(url)
+    def add_urls_to_frontier(self, urls):
+        self.url_frontier.add_urls([url for url in urls
+                                    if url.startswith(self._domain_prefixes) or get_netloc(url) == self.domain])
 
     def crawl(self, url):
         if not self.robots_parser.can_fetch(url):
-            print(f'Robots.txt disallows crawling {url}')
-            return
+            logger.info('Robots.txt disallows crawling %s', url)
+            return []
 
-        html = self.download_url(url)
-        for url in self.get_linked_urls(url, html):
-            self.add_url_to_frontier(url)
+        with self.rate_limiter.host_slot(url):
+            html = self.download_url(url)
+        return self.get_linked_urls(url, html)
 
     def run(self):
-        while not self.url_frontier.is_empty() and self.url_frontier.crawled_count < self.max_urls:
-            url = self.url_frontier.get_next_url()
-            print(f'Crawling: {url}')
-            try:
-                self.crawl(url)
-            except Exception as e:
-                print(f'Failed to crawl {url}: {e}')
-            finally:
-                self.url_frontier.mark_as_crawled(url)
-            time.sleep(1)  # Be polite, wait a second between requests
+        in_flight = {}
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while True:
+                while (len(in_flight) < self.concurrency
+                       and not self.url_frontier.is_empty()
+                       and self.url_frontier.crawled_count + len(in_flight) < self.max_urls):
+                    url = self.url_frontier.get_next_url()
+                    logger.info('Crawling: %s', url)
+                    in_flight[executor.submit(self.crawl, url)] = url
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url = in_flight.pop(future)
+                    try:
+                        self.add_urls_to_frontier(future.result())
+                    except Exception as e:
+                        logger.error('Failed to crawl %s: %s', url, e)
+                    finally:
+                        self.url_frontier.mark_as_crawled(url)
+        self.session.close()
 
 if __name__ == '__main__':
+    listener = setup_logging()
     crawler = Crawler('https://example.com', max_urls=10)  # Replace with your target website
-    crawler.run()
\ No newline at end of file
+    try:
+        crawler.run()
+    finally:
+        listener.stop()
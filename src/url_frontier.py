@@ -4,11 +4,19 @@ class URLFrontier:
     def __init__(self):
         self.urls_to_crawl = deque()
         self.crawled_urls = set()
+        self.seen_urls = set()
 
     def add_url(self, url):
-        if url not in self.crawled_urls and url not in self.urls_to_crawl:
+        if url not in self.seen_urls:
+            self.seen_urls.add(url)
             self.urls_to_crawl.append(url)
 
+    def add_urls(self, urls):
+        # Keep the caller's order so the crawl is the same from run to run.
+        new_urls = [url for url in dict.fromkeys(urls) if url not in self.seen_urls]
+        self.seen_urls.update(new_urls)
+        self.urls_to_crawl.extend(new_urls)
+
     def get_next_url(self):
         return self.urls_to_crawl.popleft() if self.urls_to_crawl else None
 
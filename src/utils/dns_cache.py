@@ -0,0 +1,33 @@
+import socket
+import threading
+import time
+
+class DNSCache:
+    def __init__(self, ttl=300, maxsize=1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.cache = {}
+        self.lock = threading.Lock()
+        self._getaddrinfo = socket.getaddrinfo
+
+    def getaddrinfo(self, *args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        with self.lock:
+            entry = self.cache.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
+
+        result = self._getaddrinfo(*args, **kwargs)
+        with self.lock:
+            if key not in self.cache and len(self.cache) >= self.maxsize:
+                self.cache.pop(next(iter(self.cache)))
+            self.cache[key] = (now + self.ttl, result)
+        return result
+
+_dns_cache = DNSCache()
+
+def install_dns_cache():
+    # socket.getaddrinfo is looked up at call time by urllib3 and urllib,
+    # so swapping it once covers every connection the process opens.
+    socket.getaddrinfo = _dns_cache.getaddrinfo
@@ -0,0 +1,14 @@
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+def setup_logging(level=logging.INFO):
+    # Callers only enqueue records; the listener thread does the stdout I/O.
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(QueueHandler(log_queue))
+    listener.start()
+    return listener
@@ -0,0 +1,34 @@
+import threading
+import time
+from contextlib import contextmanager
+from src.utils.url_utils import get_netloc
+
+class RateLimiter:
+    def __init__(self, delay=1, max_per_host=2):
+        self.delay = delay
+        self.max_per_host = max_per_host
+        self.next_request_time = {}
+        self.host_semaphores = {}
+        self.lock = threading.Lock()
+
+    def wait_for_host(self, domain):
+        # Reserve the host's next slot, then sleep outside the lock so
+        # other hosts and in-flight downloads aren't held up.
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_request_time.get(domain, 0))
+            self.next_request_time[domain] = start + self.delay
+        time.sleep(start - now)
+
+    @contextmanager
+    def host_slot(self, url):
+        # Take the host slot before reserving a start time, so a fetch that
+        # queues on the slot can't bunch up with the one it waited for.
+        domain = get_netloc(url)
+        with self.lock:
+            semaphore = self.host_semaphores.get(domain)
+            if semaphore is None:
+                semaphore = self.host_semaphores[domain] = threading.BoundedSemaphore(self.max_per_host)
+        with semaphore:
+            self.wait_for_host(domain)
+            yield
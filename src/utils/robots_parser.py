@@ -1,18 +1,74 @@
+import re
+import requests
+import threading
+import time
 import urllib.robotparser
-import urllib.parse
+from collections import OrderedDict
+from src.utils.url_utils import get_origin
+
+MAX_AGE_RE = re.compile(r'max-age=(\d+)')
 
 class RobotsParser:
-    def __init__(self):
-        self.parser = urllib.robotparser.RobotFileParser()
-        self.robot_cache = {}
+    def __init__(self, session=None, maxsize=1024, ttl=3600, min_ttl=60, max_ttl=86400):
+        self.session = session or requests.Session()
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self.robot_cache = OrderedDict()
+        self.lock = threading.Lock()
+        self.fetch_locks = {}
+
+    def fetch_robots_txt(self, origin):
+        scheme, domain = origin
+        parser = urllib.robotparser.RobotFileParser(f'{scheme}://{domain}/robots.txt')
+        response = self.session.get(parser.url, timeout=5)
+        # Same status handling as RobotFileParser.read()
+        if response.status_code in (401, 403):
+            parser.disallow_all = True
+        elif 400 <= response.status_code < 500:
+            parser.allow_all = True
+        elif response.ok:
+            parser.parse(response.content.decode('utf-8', 'replace').splitlines())
+        return parser, self.cache_ttl(response)
+
+    def cache_ttl(self, response):
+        match = MAX_AGE_RE.search(response.headers.get('Cache-Control', ''))
+        if not match:
+            return self.ttl
+        return min(max(int(match.group(1)), self.min_ttl), self.max_ttl)
+
+    def cached_parser(self, origin):
+        # Caller must hold self.lock.
+        entry = self.robot_cache.get(origin)
+        if entry is None or entry[1] <= time.monotonic():
+            return None
+        self.robot_cache.move_to_end(origin)
+        return entry[0]
+
+    def get_parser(self, origin):
+        with self.lock:
+            parser = self.cached_parser(origin)
+            if parser is not None:
+                return parser
+            fetch_lock = self.fetch_locks.setdefault(origin, threading.Lock())
 
-    def fetch_robots_txt(self, url):
-        if url not in self.robot_cache:
-            self.parser.set_url(f'{url}/robots.txt')
-            self.parser.read()
-            self.robot_cache[url] = self.parser
+        # Only one thread fetches a host's robots.txt; the rest wait for it.
+        with fetch_lock:
+            with self.lock:
+                parser = self.cached_parser(origin)
+            if parser is not None:
+                return parser
+            try:
+                parser, ttl = self.fetch_robots_txt(origin)
+                with self.lock:
+                    self.robot_cache[origin] = (parser, time.monotonic() + ttl)
+                    if len(self.robot_cache) > self.maxsize:
+                        self.robot_cache.popitem(last=False)
+            finally:
+                with self.lock:
+                    self.fetch_locks.pop(origin, None)
+        return parser
 
     def can_fetch(self, url):
-        domain = urllib.parse.urlparse(url).netloc
-        self.fetch_robots_txt(f'https://{domain}')
-        return self.robot_cache[f'https://{domain}'].can_fetch('*', url)
\ No newline at end of file
+        return self.get_parser(get_origin(url)).can_fetch('*', url)
@@ -0,0 +1,45 @@
+import sys
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit
+
+@lru_cache(maxsize=100_000)
+def normalize_url(url):
+    # Ordinary http(s) URLs are sliced by hand with str.find; anything
+    # unusual goes through urllib, whose output this must match.
+    if url.startswith('https://'):
+        start = 8
+    elif url.startswith('http://'):
+        start = 7
+    else:
+        return normalize_url_slow(url)
+    fragment = url.find('#', start)
+    if fragment >= 0:
+        url = url[:fragment]
+    query = url.find('?', start)
+    path = url.find('/', start, query if query >= 0 else len(url))
+    netloc_end = path if path >= 0 else query if query >= 0 else len(url)
+    netloc = url[start:netloc_end]
+    # urlsplit rejects non-ASCII netlocs that NFKC-normalize to a delimiter,
+    # so leave those to it.
+    if (not netloc or not netloc.isascii() or '[' in netloc or ']' in netloc
+            or not url.isprintable() or url[-1] == ' '):
+        return normalize_url_slow(url)
+    if query == len(url) - 1:
+        url = url[:-1]
+    rest = url[netloc_end:]
+    if path < 0:
+        rest = '/' + rest
+    return url[:start] + netloc.lower() + rest
+
+def normalize_url_slow(url):
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', parts.query, ''))
+
+@lru_cache(maxsize=65_536)
+def get_netloc(url):
+    # Interned so per-host dict lookups and comparisons hit the identity fast path.
+    return sys.intern(urlsplit(url).netloc)
+
+def get_origin(url):
+    parts = urlsplit(url)
+    return parts.scheme, parts.netloc
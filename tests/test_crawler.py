@@ -0,0 +1,67 @@
+import time
+import unittest
+from unittest import mock
+from urllib.parse import urljoin
+from src.crawler import Crawler
+from src.utils.url_utils import normalize_url
+
+class TestGetLinkedUrls(unittest.TestCase):
+    def setUp(self):
+        with mock.patch('src.crawler.install_dns_cache'):
+            self.crawler = Crawler('http://example.com/', delay=0)
+
+    def tearDown(self):
+        self.crawler.session.close()
+
+    def links(self, html, url='http://example.com/dir/page'):
+        return self.crawler.get_linked_urls(url, html)
+
+    def test_unclosed_tags_scan_in_linear_time(self):
+        html = b'<a ' * 200_000 + b'<base ' * 200_000 + b'<a href="/x">'
+        start = time.perf_counter()
+        self.assertEqual(self.links(html), ['http://example.com/x'])
+        self.assertLess(time.perf_counter() - start, 2)
+
+    def test_base_href(self):
+        html = b'<base href="http://example.com/other/"><a href="rel"><a href="/root">'
+        self.assertEqual(self.links(html), ['http://example.com/other/rel', 'http://example.com/root'])
+
+    def test_base_href_on_another_host(self):
+        html = b'<base href="https://cdn.example.net/x/"><a href="/root">'
+        self.assertEqual(self.links(html), ['https://cdn.example.net/root'])
+
+    def test_malformed_base_href_falls_back_to_page_url(self):
+        html = b'<base href="http://[bad"><a href="rel">'
+        self.assertEqual(self.links(html), ['http://example.com/dir/rel'])
+
+    def test_skips_non_http_schemes_case_insensitively(self):
+        html = (b'<a href="JavaScript:void(0)"><a href="MAILTO:a@example.com"><a href="Tel:123">'
+                b'<a href="#top"><a href="ftp://example.com/f"><a href=""><a href="/ok">')
+        self.assertEqual(self.links(html), ['http://example.com/ok'])
+
+    def test_relative_hrefs_match_urljoin(self):
+        page = 'http://example.com/dir/page'
+        hrefs = ['//cdn.example.com/x', '../up', './same', 'sib', '/a/./b', '/a/../b',
+                 '?q=1', '/', 'HTTP://Example.com/Abs', 'https://example.com']
+        html = ''.join(f'<a href="{href}">' for href in hrefs).encode()
+        expected = list(dict.fromkeys(normalize_url(urljoin(page, href)) for href in hrefs))
+        self.assertEqual(self.links(html, page), expected)
+
+    def test_unescapes_entities(self):
+        html = b'<a href="/s?a=1&amp;b=2"><a href=\'/t?x=&quot;y&quot;\'>'
+        self.assertEqual(self.links(html), ['http://example.com/s?a=1&b=2', 'http://example.com/t?x="y"'])
+
+    def test_dedupes_in_document_order(self):
+        html = b'<a href="/b"><a href="/a"><a href="/b"><A HREF=/a><a href="http://EXAMPLE.com/c#f">'
+        self.assertEqual(self.links(html), ['http://example.com/b', 'http://example.com/a', 'http://example.com/c'])
+
+    def test_bad_href_keeps_rest_of_page(self):
+        html = '<a href="/a"><a href="http://example.jp／page"><a href="http://[bad"><a href="/b">'.encode()
+        links = self.links(html)
+        self.assertEqual(links, ['http://example.com/a', 'http://example.com/b'])
+        self.crawler.add_urls_to_frontier(links)
+        self.assertEqual(list(self.crawler.url_frontier.urls_to_crawl),
+                         ['http://example.com/', 'http://example.com/a', 'http://example.com/b'])
+
+if __name__ == '__main__':
+    unittest.main()